@@ -1,3 +1,3 @@
-from .parser import HarParser
+from .parser import Endpoint, HarParser
 
 __version__ = "0.1.0"
@@ -0,0 +1,134 @@
+"""
+Numba compiled scan for the unique domains of a large number of URLs.
+
+Importing this module imports numba, which is slow, so the parser only loads
+it when HAR_INSPECTOR_USE_NUMBA=1 is set.
+"""
+from typing import Iterable, List, Set
+
+import numpy as np
+from numba import njit, types
+from numba.typed import Dict as TypedDict
+
+_COLON = ord(':')
+_SLASH = ord('/')
+_QUESTION = ord('?')
+_HASH = ord('#')
+_TAB = ord('\t')
+_LF = ord('\n')
+_CR = ord('\r')
+
+_FNV_OFFSET = np.uint64(0xcbf29ce484222325)
+_FNV_PRIME = np.uint64(0x100000001b3)
+
+
+@njit(cache=True)
+def _is_ascii_alpha(byte):
+    return (65 <= byte <= 90) or (97 <= byte <= 122)
+
+
+@njit(cache=True)
+def scan_netlocs(buf, offsets):
+    """
+    Find the unique netlocs of the URLs packed in buf.
+
+    URL i occupies buf[offsets[i]:offsets[i + 1]]. Netlocs are deduplicated
+    by their FNV-1a hash, hash collisions are confirmed with a byte compare.
+
+    Args:
+        buf: uint8 array holding the concatenated UTF-8 encoded URLs
+        offsets: int64 array of URL boundaries, one longer than the URL count
+
+    Returns:
+        Tuple of (starts, ends, fallback) where buf[starts[j]:ends[j]] are the
+        unique netlocs and fallback holds the indexes of the URLs that must be
+        split in Python (no plain "scheme://" prefix, a tab or newline in the
+        netloc, or a hash collision)
+    """
+    n = len(offsets) - 1
+    seen = TypedDict.empty(key_type=types.uint64, value_type=types.int64)
+    starts = np.empty(n, np.int64)
+    ends = np.empty(n, np.int64)
+    fallback = np.empty(n, np.int64)
+    count = 0
+    fallback_count = 0
+
+    for u in range(n):
+        lo = offsets[u]
+        hi = offsets[u + 1]
+
+        # Locate "://" after an ASCII alphabetic scheme
+        sep = -1
+        i = lo
+        while i < hi and _is_ascii_alpha(buf[i]):
+            i += 1
+        if i > lo and i + 2 < hi and buf[i] == _COLON and buf[i + 1] == _SLASH and buf[i + 2] == _SLASH:
+            sep = i
+        if sep == -1:
+            fallback[fallback_count] = u
+            fallback_count += 1
+            continue
+
+        start = sep + 3
+        end = start
+        h = _FNV_OFFSET
+        # urlsplit removes tabs and newlines, leave those netlocs to it
+        stripped = False
+        while end < hi:
+            byte = buf[end]
+            if byte == _SLASH or byte == _QUESTION or byte == _HASH:
+                break
+            if byte == _TAB or byte == _LF or byte == _CR:
+                stripped = True
+                break
+            h = (h ^ np.uint64(byte)) * _FNV_PRIME
+            end += 1
+        if stripped:
+            fallback[fallback_count] = u
+            fallback_count += 1
+            continue
+
+        if h in seen:
+            j = seen[h]
+            same = ends[j] - starts[j] == end - start
+            k = 0
+            while same and k < end - start:
+                if buf[starts[j] + k] != buf[start + k]:
+                    same = False
+                k += 1
+            if not same:
+                fallback[fallback_count] = u
+                fallback_count += 1
+            continue
+
+        seen[h] = count
+        starts[count] = start
+        ends[count] = end
+        count += 1
+
+    return starts[:count], ends[:count], fallback[:fallback_count]
+
+
+def unique_netlocs(urls: Iterable[str], split_url) -> Set[str]:
+    """
+    Collect the unique netlocs of urls with the compiled scan.
+
+    Args:
+        urls: URL strings
+        split_url: Python URL splitter used for the URLs the scan can't handle
+
+    Returns:
+        Set of netlocs
+    """
+    encoded: List[bytes] = [url.encode('utf-8') for url in urls]
+    offsets = np.zeros(len(encoded) + 1, np.int64)
+    np.cumsum(np.fromiter(map(len, encoded), np.int64, len(encoded)), out=offsets[1:])
+    data = b''.join(encoded)
+    buf = np.frombuffer(data, np.uint8)
+
+    starts, ends, fallback = scan_netlocs(buf, offsets)
+
+    netlocs = {data[s:e].decode('utf-8') for s, e in zip(starts.tolist(), ends.tolist())}
+    for u in fallback.tolist():
+        netlocs.add(split_url(encoded[u].decode('utf-8'))[1])
+    return netlocs
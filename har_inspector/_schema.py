@@ -0,0 +1,67 @@
+"""
+Typed msgspec schema for the parts of a HAR file the parser reads.
+
+Decoding into these structs fills in missing fields with defaults once, and
+skips every field that is not declared here (response bodies, cookies,
+timings, ...) without allocating it.
+"""
+from typing import List, Optional, Union
+
+import msgspec
+
+
+class NameValue(msgspec.Struct):
+    name: str = ''
+    value: str = ''
+
+
+class PostData(msgspec.Struct):
+    mimeType: str = ''
+    text: str = ''
+
+
+class Request(msgspec.Struct):
+    method: str = ''
+    url: str = ''
+    headers: List[NameValue] = []
+    queryString: List[NameValue] = []
+    postData: Optional[PostData] = None
+
+
+class Response(msgspec.Struct):
+    status: int = 0
+    bodySize: Union[int, float] = 0
+
+
+class Entry(msgspec.Struct):
+    request: Request = msgspec.field(default_factory=Request)
+    response: Response = msgspec.field(default_factory=Response)
+    time: Union[int, float] = 0
+
+
+class Log(msgspec.Struct):
+    entries: List[Entry] = []
+
+
+class Har(msgspec.Struct):
+    log: Log = msgspec.field(default_factory=Log)
+
+
+_decoder = msgspec.json.Decoder(Har)
+
+
+def decode_entries(data) -> List[Entry]:
+    """
+    Decode the log entries of a HAR document.
+
+    Args:
+        data: HAR document as bytes or a buffer
+
+    Returns:
+        List of typed entries
+
+    Raises:
+        msgspec.DecodeError: if data is not valid JSON
+        msgspec.ValidationError: if data doesn't fit the schema
+    """
+    return _decoder.decode(data).log.entries
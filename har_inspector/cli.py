@@ -1,8 +1,9 @@
 import argparse
+import functools
+import os
 import sys
-import json
 from typing import List, Optional
-from .parser import HarParser
+from .parser import CSV_FIELDS, ENDPOINT_FIELDS, HarParser, endpoints_to_json
 
 
 def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
@@ -65,6 +66,25 @@ def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
     return parser.parse_args(args)
 
 
+@functools.lru_cache(maxsize=8)
+def _get_parser(har_file: str, mtime_ns: int, size: int) -> HarParser:
+    """
+    Get a HarParser for a file, reused while the file is unchanged.
+    
+    Repeated calls to main in the same process (scripts, REPL sessions)
+    then only parse each HAR file once.
+    
+    Args:
+        har_file: Resolved path to the HAR file
+        mtime_ns: Modification time of the file, part of the cache key
+        size: Size of the file, part of the cache key
+        
+    Returns:
+        HarParser for the file
+    """
+    return HarParser(har_file)
+
+
 def main(args: Optional[List[str]] = None) -> int:
     """
     Main entry point for the CLI.
@@ -78,7 +98,14 @@ def main(args: Optional[List[str]] = None) -> int:
     parsed_args = parse_args(args)
     
     try:
-        parser = HarParser(parsed_args.har_file)
+        # Key the cache on the resolved path, a relative path names another
+        # file after a chdir
+        har_file = os.path.realpath(parsed_args.har_file)
+        try:
+            st = os.stat(har_file)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"HAR file not found: {parsed_args.har_file}")
+        parser = _get_parser(har_file, st.st_mtime_ns, st.st_size)
         
         if parsed_args.list_domains:
             domains = parser.get_unique_domains()
@@ -87,22 +114,36 @@ def main(args: Optional[List[str]] = None) -> int:
                 print(f"  - {domain}")
             return 0
         
+        # CSV export only writes the flat fields, skip building the nested ones
+        if parsed_args.output and parsed_args.output.lower().endswith('.csv'):
+            fields = CSV_FIELDS
+        else:
+            fields = ENDPOINT_FIELDS
+            
         if parsed_args.api_only:
-            endpoints = parser.get_api_endpoints()
+            endpoints = parser.get_api_endpoints(fields=fields)
         else:
             endpoints = parser.get_endpoints(
                 domain=parsed_args.domain,
                 method=parsed_args.method,
                 status_code=parsed_args.status,
-                path_pattern=parsed_args.pattern
+                path_pattern=parsed_args.pattern,
+                fields=fields
             )
         
         if parsed_args.output:
             parser.export_endpoints(endpoints, parsed_args.output)
             print(f"Exported {len(endpoints)} endpoints to {parsed_args.output}")
         else:
-            # Print to stdout
-            print(json.dumps(endpoints, indent=2))
+            # Print to stdout, writing the bytes directly when possible
+            output = endpoints_to_json(endpoints)
+            stdout = getattr(sys.stdout, 'buffer', None)
+            if stdout is None:
+                print(output.decode('utf-8'))
+            else:
+                sys.stdout.flush()
+                stdout.write(output + b'\n')
+                stdout.flush()
             
         return 0
         
@@ -2,8 +2,562 @@ import json
 import csv
 import re
 import os
-from urllib.parse import urlparse
-from typing import Dict, List, Optional, Union, Set
+import sys
+import mmap
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import starmap
+from dataclasses import dataclass
+from operator import attrgetter, itemgetter
+from urllib.parse import urlsplit
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, Pattern, Tuple, Union, Set
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+try:
+    from . import _schema
+except ImportError:
+    _schema = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, but list both explicitly
+if orjson is None:
+    _JSON_DECODE_ERRORS = (json.JSONDecodeError,)
+else:
+    _JSON_DECODE_ERRORS = (json.JSONDecodeError, orjson.JSONDecodeError)
+    
+_json_loads = json.loads if orjson is None else orjson.loads
+
+# HAR files larger than this are memory-mapped instead of read into memory
+MMAP_THRESHOLD = 100 * 1024 * 1024
+
+# Below this many entries get_endpoints_parallel runs serially, as shipping
+# the entries to worker processes would cost more than it saves
+PARALLEL_MIN_ENTRIES = 5000
+
+# Parsed HAR files are cached next to the original when HAR_INSPECTOR_CACHE=1
+# and msgspec is installed
+CACHE_SUFFIX = '.harcache'
+
+# Default patterns to identify API endpoints, most frequent matches first
+# and the anchored pattern last
+DEFAULT_API_PATTERNS = (
+    r'/api/',
+    r'/rest/',
+    r'/v\d+/',
+    r'/graphql',
+    r'/gql',
+    r'\.json$',
+)
+_DEFAULT_API_RE = re.compile('(?:' + '|'.join(DEFAULT_API_PATTERNS) + ')')
+
+# Characters a JSON document can start with
+_JSON_START_CHARS = frozenset('{["-0123456789tfn')
+
+# Interned names of the common HTTP methods, so every endpoint shares them
+_METHOD_NAMES = {
+    name: sys.intern(name)
+    for name in ('GET', 'POST', 'PUT', 'DELETE', 'PATCH', 'HEAD', 'OPTIONS')
+}
+
+# Fields get_endpoints can extract for each endpoint
+ENDPOINT_FIELDS = frozenset({
+    'url', 'method', 'protocol', 'domain', 'path', 'query_params',
+    'headers', 'post_data', 'status_code', 'response_size', 'time',
+})
+
+# Flat fields written by CSV export, in column order
+CSV_FIELDS = ('url', 'method', 'protocol', 'domain', 'path', 'status_code', 'response_size', 'time')
+
+# CSV fields holding numbers, the others are strings
+_NUMERIC_FIELDS = frozenset({'status_code', 'response_size', 'time'})
+
+
+def _split_url(url: str) -> Tuple[str, str, str]:
+    """
+    Split a URL into its scheme, netloc and path.
+    
+    This only handles the common "scheme://netloc/path" shape with an ASCII
+    alphabetic scheme with a few str.find calls, and hands anything else,
+    including URLs with tabs or newlines urlsplit would remove, to
+    urllib.parse.urlsplit.
+    
+    Args:
+        url: URL to split
+        
+    Returns:
+        Tuple of (scheme, netloc, path)
+    """
+    scheme_end = url.find('://')
+    scheme = url[:scheme_end]
+    if (scheme_end <= 0 or not (scheme.isascii() and scheme.isalpha())
+            or '\t' in url or '\r' in url or '\n' in url):
+        parts = urlsplit(url)
+        return parts.scheme, parts.netloc, parts.path
+        
+    netloc_start = scheme_end + 3
+    netloc_end = len(url)
+    for sep in '/?#':
+        i = url.find(sep, netloc_start, netloc_end)
+        if i != -1:
+            netloc_end = i
+            
+    path_end = len(url)
+    for sep in '?#':
+        i = url.find(sep, netloc_end, path_end)
+        if i != -1:
+            path_end = i
+            
+    return scheme.lower(), url[netloc_start:netloc_end], url[netloc_end:path_end]
+
+
+@dataclass
+class Endpoint:
+    """An endpoint extracted from a HAR entry, fields not extracted are None."""
+    
+    __slots__ = (
+        'url', 'method', 'protocol', 'domain', 'path', 'query_params',
+        'headers', 'post_data', 'status_code', 'response_size', 'time',
+    )
+    
+    url: str
+    method: str
+    protocol: str
+    domain: str
+    path: str
+    query_params: Optional[Dict[str, str]]
+    headers: Optional[Dict[str, str]]
+    post_data: Any
+    status_code: int
+    response_size: int
+    time: float
+    
+    def __getitem__(self, key: str) -> Any:
+        """
+        Dictionary style field access, for code written against endpoint dicts.
+        """
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+        
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the endpoint to a dictionary.
+        
+        Returns:
+            Dictionary mapping field names to values
+        """
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+def _read_dict_entries(entries: Iterable[Dict]) -> Iterator[Tuple]:
+    """
+    Read the fields every filter needs from HAR entry dictionaries.
+    
+    Args:
+        entries: HAR log entries
+        
+    Returns:
+        Iterator over (entry, request, response, method, status, url) tuples
+    """
+    for entry in entries:
+        request = entry.get('request', {})
+        response = entry.get('response', {})
+        yield (entry, request, response, request.get('method', ''),
+               response.get('status', 0), request.get('url', ''))
+
+
+def _read_dict_details(entry: Dict, request: Dict, response: Dict,
+                       want_query_params: bool, want_headers: bool,
+                       want_post_data: bool) -> Tuple:
+    """
+    Read the remaining endpoint fields from a HAR entry dictionary.
+    
+    Args:
+        entry: HAR log entry
+        request: The entry's request
+        response: The entry's response
+        want_query_params: Extract the query parameters
+        want_headers: Extract the headers
+        want_post_data: Extract the post data
+        
+    Returns:
+        Tuple of (query_params, headers, post_data, response_size, time)
+    """
+    # The HAR spec requires name and value on query parameters and headers,
+    # so only fall back to .get if one is missing
+    query_params = headers = None
+    try:
+        if want_query_params:
+            query_params = {p['name']: p['value'] for p in request.get('queryString', ())}
+        if want_headers:
+            headers = {h['name']: h['value'] for h in request.get('headers', ())}
+    except KeyError:
+        if want_query_params:
+            query_params = _name_value_dict(request.get('queryString', ()))
+        if want_headers:
+            headers = _name_value_dict(request.get('headers', ()))
+            
+    post_data = None
+    if want_post_data and 'postData' in request:
+        post_data = request['postData']
+        post_data = _decode_post_data(post_data.get('text', ''), post_data.get('mimeType', ''))
+        
+    # Response time in ms
+    return query_params, headers, post_data, response.get('bodySize', 0), entry.get('time', 0)
+
+
+def _read_typed_entries(entries: Iterable['_schema.Entry']) -> Iterator[Tuple]:
+    """
+    Read the fields every filter needs from typed msgspec HAR entries.
+    
+    Missing fields were already filled in with defaults when decoding, so
+    every access is a plain attribute lookup.
+    
+    Args:
+        entries: Typed HAR log entries
+        
+    Returns:
+        Iterator over (entry, request, response, method, status, url) tuples
+    """
+    for entry in entries:
+        request = entry.request
+        response = entry.response
+        yield entry, request, response, request.method, response.status, request.url
+
+
+def _read_typed_details(entry: '_schema.Entry', request: '_schema.Request',
+                        response: '_schema.Response', want_query_params: bool,
+                        want_headers: bool, want_post_data: bool) -> Tuple:
+    """
+    Read the remaining endpoint fields from a typed msgspec HAR entry.
+    
+    See _read_dict_details for the arguments and return value.
+    """
+    query_params = headers = post_data = None
+    if want_query_params:
+        query_params = {p.name: p.value for p in request.queryString}
+    if want_headers:
+        headers = {h.name: h.value for h in request.headers}
+    if want_post_data and request.postData is not None:
+        post_data = _decode_post_data(request.postData.text, request.postData.mimeType)
+    return query_params, headers, post_data, response.bodySize, entry.time
+
+
+def _iter_endpoint_rows(entries: Iterable,
+                        typed: bool,
+                        domain: Optional[str],
+                        method: Optional[str],
+                        status_code: Optional[int],
+                        path_pattern: Optional[Pattern],
+                        fields: FrozenSet[str],
+                        domains: Optional[Set[str]] = None) -> Iterator[Tuple]:
+    """
+    Filter HAR entries and yield the endpoint fields of the matching ones.
+    
+    Args:
+        entries: HAR log entries, dictionaries or typed msgspec structs
+        typed: Whether entries are typed msgspec structs
+        domain: Filter by domain name
+        method: Filter by HTTP method
+        status_code: Filter by HTTP status code
+        path_pattern: Compiled URL path pattern to filter by
+        fields: Validated names of the fields to extract, the others are None
+        domains: If given, the domain of every entry is added to this set
+        
+    Returns:
+        Iterator over tuples of field values, in Endpoint field order
+    """
+    if typed:
+        read_entries, read_details = _read_typed_entries, _read_typed_details
+    else:
+        read_entries, read_details = _read_dict_entries, _read_dict_details
+        
+    want_url = 'url' in fields
+    want_method = 'method' in fields
+    want_protocol = 'protocol' in fields
+    want_domain = 'domain' in fields
+    want_path = 'path' in fields
+    want_query_params = 'query_params' in fields
+    want_headers = 'headers' in fields
+    want_post_data = 'post_data' in fields
+    want_status_code = 'status_code' in fields
+    want_response_size = 'response_size' in fields
+    want_time = 'time' in fields
+    
+    # Every netloc follows a '//', so URLs without this marker can be
+    # rejected before they are split
+    domain_marker = '//' + domain if domain else None
+    
+    # Methods, protocols and domains repeat across entries, share one string
+    # object per value instead of keeping a copy in every endpoint
+    if method:
+        method = sys.intern(method)
+    method_names = _METHOD_NAMES
+    intern = sys.intern
+    shared = {}
+    share = shared.setdefault
+    
+    add_domain = domains.add if domains is not None else None
+    
+    # Bind everything used per entry to locals outside the loop
+    split_url = _split_url
+    search_path = path_pattern.search if path_pattern else None
+    
+    # The URL only needs splitting when one of its parts is filtered on or kept
+    need_split = bool(domain or search_path or add_domain
+                      or want_protocol or want_domain or want_path)
+    protocol = netloc = path = None
+    
+    for entry, request, response, request_method, response_status, url in read_entries(entries):
+        # Skip if method filter is provided and doesn't match
+        request_method = method_names.get(request_method) or (
+            intern(request_method) if isinstance(request_method, str) else request_method)
+        if method and request_method != method:
+            continue
+            
+        # Skip if status code filter is provided and doesn't match
+        if status_code and response_status != status_code:
+            continue
+            
+        if domain_marker and domain_marker not in url:
+            continue
+            
+        if need_split:
+            protocol, netloc, path = split_url(url)
+            protocol = share(protocol, protocol)
+            netloc = share(netloc, netloc)
+            if add_domain is not None:
+                add_domain(netloc)
+                
+        # Skip if domain filter is provided and doesn't match
+        if domain and netloc != domain:
+            continue
+            
+        # Skip if path pattern is provided and doesn't match
+        if search_path and not search_path(path):
+            continue
+            
+        query_params, headers, post_data, response_size, time = read_details(
+            entry, request, response, want_query_params, want_headers, want_post_data)
+            
+        # Fields that were not requested are left as None
+        yield (
+            url if want_url else None,
+            request_method if want_method else None,
+            protocol if want_protocol else None,
+            netloc if want_domain else None,
+            path if want_path else None,
+            query_params,
+            headers,
+            post_data,
+            response_status if want_status_code else None,
+            response_size if want_response_size else None,
+            time if want_time else None,
+        )
+
+
+def _extract_endpoints(entries: Iterable,
+                       typed: bool,
+                       domain: Optional[str],
+                       method: Optional[str],
+                       status_code: Optional[int],
+                       path_pattern: Optional[Pattern],
+                       fields: FrozenSet[str],
+                       collect_domains: bool = False) -> Tuple[List[Endpoint], Optional[Set[str]]]:
+    """
+    Extract the endpoints matching the filters from HAR entries.
+    
+    This is a module level function so it can be sent to worker processes.
+    
+    Args:
+        entries: HAR log entries, dictionaries or typed msgspec structs
+        typed: Whether entries are typed msgspec structs
+        domain: Filter by domain name
+        method: Filter by HTTP method
+        status_code: Filter by HTTP status code
+        path_pattern: Compiled URL path pattern to filter by
+        fields: Validated names of the fields to extract
+        collect_domains: Also collect the domain of every entry
+        
+    Returns:
+        Tuple of (Endpoint objects, set of domains or None)
+    """
+    domains = set() if collect_domains else None
+    rows = _iter_endpoint_rows(entries, typed, domain, method, status_code,
+                               path_pattern, fields, domains)
+    return list(starmap(Endpoint, rows)), domains
+
+
+def _decode_post_data(text: Any, mime_type: Any) -> Any:
+    """
+    Decode post data text, only bodies with a JSON mime type that start like
+    a JSON value are decoded.
+    
+    Args:
+        text: Post data text
+        mime_type: Post data mime type
+        
+    Returns:
+        The decoded JSON value, or the text if it isn't JSON
+    """
+    # Mime types are case-insensitive, and may be missing or null in the HAR
+    mime_type = mime_type.lower() if isinstance(mime_type, str) else ''
+    if 'json' in mime_type and isinstance(text, str) and text.lstrip()[:1] in _JSON_START_CHARS:
+        try:
+            return _json_loads(text)
+        except ValueError:
+            # Keep as string if it is not valid JSON after all
+            pass
+    return text
+
+
+def _check_fields(fields: Iterable[str]) -> FrozenSet[str]:
+    """
+    Validate endpoint field names.
+    
+    Args:
+        fields: Names of the fields to extract
+        
+    Returns:
+        The field names as a frozenset
+    """
+    fields = frozenset(fields)
+    unknown = fields - ENDPOINT_FIELDS
+    if unknown:
+        raise ValueError(f"Unknown endpoint fields: {', '.join(sorted(unknown))}")
+    return fields
+
+
+def _cache_enabled() -> bool:
+    """
+    Whether the on-disk cache of parsed HAR files is enabled.
+    
+    The cache needs msgspec: it is stored next to HAR files that may come
+    from anyone, so it must be data only msgpack, never pickle.
+    """
+    return msgspec is not None and os.environ.get('HAR_INSPECTOR_CACHE') == '1'
+
+
+def _cache_dumps(obj: Any) -> bytes:
+    """
+    Serialize a cache payload as msgpack.
+    """
+    return msgspec.msgpack.encode(obj)
+
+
+def _cache_loads(data: bytes) -> Any:
+    """
+    Deserialize a cache payload written by _cache_dumps.
+    """
+    return msgspec.msgpack.decode(data)
+
+
+def _load_netloc_scan():
+    """
+    Import the numba domain scan if HAR_INSPECTOR_USE_NUMBA=1 is set.
+    
+    Returns:
+        The _netloc_scan module, or None if disabled or numba is not installed
+    """
+    if os.environ.get('HAR_INSPECTOR_USE_NUMBA') != '1':
+        return None
+    try:
+        from . import _netloc_scan
+    except ImportError:
+        return None
+    return _netloc_scan
+
+
+def _import_pyarrow():
+    """
+    Import pyarrow on demand, it is only needed for the table methods.
+    
+    Returns:
+        The pyarrow module, with pyarrow.csv loaded
+    """
+    try:
+        import pyarrow
+        import pyarrow.csv  # noqa: F401
+    except ImportError:
+        raise ImportError("pyarrow is required for endpoint tables: pip install pyarrow")
+    return pyarrow
+
+
+def _table_number(value: Any) -> Union[int, float, None]:
+    """
+    Convert a numeric field of a dict entry for a pyarrow column.
+    
+    Dict entries are not validated, so a number can also be a string such as
+    "200" or some other JSON value, which becomes None.
+    
+    Args:
+        value: Field value
+        
+    Returns:
+        The value as an int or float, or None
+    """
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        for convert in (int, float):
+            try:
+                return convert(value)
+            except ValueError:
+                pass
+    return None
+
+
+def _json_default(obj: Any) -> Any:
+    """
+    Serialize the objects json doesn't know about (orjson handles dataclasses).
+    """
+    if isinstance(obj, Endpoint):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def endpoints_to_json(endpoints: List[Union[Endpoint, Dict]]) -> bytes:
+    """
+    Serialize endpoints as indented UTF-8 encoded JSON.
+    
+    Args:
+        endpoints: List of Endpoint objects or endpoint dictionaries
+        
+    Returns:
+        JSON document as bytes
+    """
+    if orjson is None:
+        return json.dumps(endpoints, indent=2, default=_json_default).encode('utf-8')
+    # HAR header and query names can be null or numbers, json.dumps turns
+    # those keys into strings and OPT_NON_STR_KEYS does the same
+    return orjson.dumps(endpoints, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+
+
+def _name_value_dict(items: List[Dict]) -> Dict[str, str]:
+    """
+    Build a dict from HAR name/value pairs, tolerating missing keys.
+    
+    Args:
+        items: List of HAR name/value objects
+        
+    Returns:
+        Dictionary mapping names to values
+    """
+    return {item.get('name', ''): item.get('value', '') for item in items}
 
 
 class HarParser:
@@ -17,28 +571,218 @@ class HarParser:
             har_file_path: Path to the HAR file
         """
         self.har_file_path = har_file_path
-        self.har_data = self._load_har_file()
+        self._har_data = None
+        self._pattern_cache: Dict[str, Pattern] = {}
+        self._domains: Optional[Set[str]] = None
+        # Typed entries, when the file was decoded with the msgspec schema
+        self._entries: Optional[List['_schema.Entry']] = None
+        
+        # The on-disk cache takes precedence, then ijson streaming (bounded
+        # memory), then the typed msgspec decode, then a plain JSON load
+        if _cache_enabled():
+            self._har_data = self._load_har_file()
+        elif ijson is not None:
+            # Entries are streamed on demand, only validate the file up front
+            self._check_har_file()
+        else:
+            if _schema is not None:
+                self._entries = self._decode_entries()
+            if self._entries is None:
+                self._har_data = self._load_har_file()
+            
+    @property
+    def har_data(self) -> Dict:
+        """
+        The fully parsed HAR document, loaded on first access when streaming.
+        """
+        if self._har_data is None:
+            self._har_data = self._load_har_file()
+        return self._har_data
         
+    def _check_har_file(self) -> None:
+        """
+        Check that the HAR file exists and starts with a valid JSON document.
+        """
+        try:
+            with open(self.har_file_path, 'rb') as f:
+                next(ijson.parse(f))
+        except (ijson.JSONError, StopIteration):
+            raise ValueError(f"Invalid HAR file format: {self.har_file_path}")
+        except FileNotFoundError:
+            raise FileNotFoundError(f"HAR file not found: {self.har_file_path}")
+            
     def _load_har_file(self) -> Dict:
         """
-        Load and parse the HAR file.
+        Load the HAR file, going through the on-disk cache when it is enabled.
+        
+        Returns:
+            Dict containing the parsed HAR data
+        """
+        if not _cache_enabled():
+            return self._parse_har_file()
+            
+        try:
+            st = os.stat(self.har_file_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"HAR file not found: {self.har_file_path}")
+        cache_key = [st.st_mtime_ns, st.st_size]
+        cache_path = self.har_file_path + CACHE_SUFFIX
+        
+        try:
+            with open(cache_path, 'rb') as f:
+                cached = _cache_loads(f.read())
+            if cached[0] == cache_key:
+                return cached[1]
+        except Exception:
+            # Missing, stale or unreadable cache, parse the HAR file instead
+            pass
+            
+        har_data = self._parse_har_file()
+        
+        # Write atomically so concurrent runs never see a partial cache
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path) or '.',
+                                            suffix=CACHE_SUFFIX)
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(_cache_dumps([cache_key, har_data]))
+                os.replace(tmp_path, cache_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except Exception:
+            # The cache is only an optimization, ignore failures to write it
+            pass
+            
+        return har_data
+        
+    def _decode_entries(self) -> Optional[List['_schema.Entry']]:
+        """
+        Decode the HAR entries into typed msgspec structs.
+        
+        Returns:
+            List of typed entries, or None if the file doesn't fit the schema
+        """
+        try:
+            return self._decode_bytes(_schema.decode_entries)
+        except msgspec.ValidationError:
+            # Valid JSON with unexpected types, leave it to the dict based path
+            return None
+        except msgspec.DecodeError:
+            raise ValueError(f"Invalid HAR file format: {self.har_file_path}")
+        except FileNotFoundError:
+            raise FileNotFoundError(f"HAR file not found: {self.har_file_path}")
+            
+    def _decode_bytes(self, decode: Callable[[Any], Any]) -> Any:
+        """
+        Decode the raw bytes of the HAR file, memory-mapping large files.
+        
+        Args:
+            decode: Function decoding a bytes-like object
+            
+        Returns:
+            The decoded data
+        """
+        with open(self.har_file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size > MMAP_THRESHOLD:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    with memoryview(mm) as buf:
+                        return decode(buf)
+            return decode(f.read())
+            
+    def _parse_har_file(self) -> Dict:
+        """
+        Parse the HAR file.
         
         Returns:
             Dict containing the parsed HAR data
         """
         try:
-            with open(self.har_file_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except json.JSONDecodeError:
+            if orjson is None:
+                with open(self.har_file_path, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+                    
+            # orjson works on bytes, so skip the text decoding layer entirely
+            return self._decode_bytes(orjson.loads)
+        except _JSON_DECODE_ERRORS:
             raise ValueError(f"Invalid HAR file format: {self.har_file_path}")
         except FileNotFoundError:
             raise FileNotFoundError(f"HAR file not found: {self.har_file_path}")
+            
+    def _compile_pattern(self, pattern: str) -> Pattern:
+        """
+        Compile a regex pattern, reusing earlier compilations of the same string.
+        
+        Args:
+            pattern: Regex pattern string
+            
+        Returns:
+            Compiled regex pattern
+        """
+        compiled = self._pattern_cache.get(pattern)
+        if compiled is None:
+            compiled = self._pattern_cache[pattern] = re.compile(pattern)
+        return compiled
+        
+    def _stream_items(self, prefix: str) -> Iterator:
+        """
+        Stream the JSON items found under prefix without loading the whole file.
+        
+        Args:
+            prefix: ijson prefix of the items to yield
+            
+        Returns:
+            Iterator over the decoded items
+        """
+        with open(self.har_file_path, 'rb') as f:
+            try:
+                yield from ijson.items(f, prefix, use_float=True)
+            except ijson.JSONError:
+                raise ValueError(f"Invalid HAR file format: {self.har_file_path}")
+                
+    def _iter_entries(self) -> Iterator[Dict]:
+        """
+        Iterate over the HAR log entries.
+        
+        Returns:
+            Iterator over entry dictionaries
+        """
+        if self._har_data is None and ijson is not None:
+            yield from self._stream_items('log.entries.item')
+        elif 'log' in self.har_data and 'entries' in self.har_data['log']:
+            yield from self.har_data['log']['entries']
+            
+    def _entries_and_typed(self) -> Tuple[Iterable, bool]:
+        """
+        Pick the entries to extract endpoints from.
+        
+        Returns:
+            Tuple of (entries, whether they are typed msgspec structs)
+        """
+        if self._entries is not None:
+            return self._entries, True
+        return self._iter_entries(), False
+        
+    def _iter_urls(self) -> Iterator[str]:
+        """
+        Iterate over the request URLs, defaulting a missing URL to ''.
+        
+        Returns:
+            Iterator over URL strings
+        """
+        if self._entries is not None:
+            for entry in self._entries:
+                yield entry.request.url
+        else:
+            for entry in self._iter_entries():
+                yield entry.get('request', {}).get('url', '')
     
     def get_endpoints(self, 
                      domain: Optional[str] = None,
                      method: Optional[str] = None,
                      status_code: Optional[int] = None,
-                     path_pattern: Optional[str] = None) -> List[Dict]:
+                     path_pattern: Optional[Union[str, Pattern]] = None,
+                     fields: Iterable[str] = ENDPOINT_FIELDS) -> List[Endpoint]:
         """
         Extract API endpoints from the HAR file with optional filtering.
         
@@ -46,80 +790,133 @@ class HarParser:
             domain: Filter by domain name
             method: Filter by HTTP method (GET, POST, etc.)
             status_code: Filter by HTTP status code
-            path_pattern: Filter by URL path pattern (regex)
+            path_pattern: Filter by URL path pattern (regex string or compiled pattern)
+            fields: Names of the fields to extract (defaults to ENDPOINT_FIELDS),
+                    the others are left as None
             
         Returns:
-            List of dictionaries containing endpoint information
+            List of Endpoint objects
         """
-        if 'log' not in self.har_data or 'entries' not in self.har_data['log']:
-            return []
+        if isinstance(path_pattern, str):
+            path_pattern = self._compile_pattern(path_pattern)
+        return self._get_endpoints_with_compiled(domain, method, status_code, path_pattern, fields)
         
-        endpoints = []
+    def _get_endpoints_with_compiled(self,
+                                     domain: Optional[str],
+                                     method: Optional[str],
+                                     status_code: Optional[int],
+                                     path_pattern: Optional[Pattern],
+                                     fields: Iterable[str]) -> List[Endpoint]:
+        """
+        Extract endpoints, taking the path pattern already compiled.
+        
+        See get_endpoints for the arguments and return value.
+        """
+        fields = _check_fields(fields)
         
-        for entry in self.har_data['log']['entries']:
-            request = entry.get('request', {})
-            response = entry.get('response', {})
+        # An unfiltered pass sees every URL, so collect the domains on the way
+        # for get_unique_domains
+        collect_domains = (self._domains is None
+                           and not (domain or method or status_code or path_pattern))
+        entries, typed = self._entries_and_typed()
+        endpoints, domains = _extract_endpoints(entries, typed, domain, method, status_code,
+                                                path_pattern, fields, collect_domains)
+        if domains is not None:
+            self._domains = domains
             
-            url = request.get('url', '')
-            parsed_url = urlparse(url)
+        return endpoints
+    
+    def get_endpoints_parallel(self,
+                               domain: Optional[str] = None,
+                               method: Optional[str] = None,
+                               status_code: Optional[int] = None,
+                               path_pattern: Optional[Union[str, Pattern]] = None,
+                               fields: Iterable[str] = ENDPOINT_FIELDS,
+                               workers: Optional[int] = None) -> List[Endpoint]:
+        """
+        Extract API endpoints like get_endpoints, spreading the work over processes.
+        
+        Args:
+            domain: Filter by domain name
+            method: Filter by HTTP method (GET, POST, etc.)
+            status_code: Filter by HTTP status code
+            path_pattern: Filter by URL path pattern (regex string or compiled pattern)
+            fields: Names of the fields to extract (see get_endpoints)
+            workers: Number of worker processes (defaults to the CPU count)
             
-            # Skip if domain filter is provided and doesn't match
-            if domain and parsed_url.netloc != domain:
-                continue
-                
-            # Skip if method filter is provided and doesn't match
-            request_method = request.get('method', '')
-            if method and request_method != method:
-                continue
-                
-            # Skip if status code filter is provided and doesn't match
-            response_status = response.get('status', 0)
-            if status_code and response_status != status_code:
-                continue
-                
-            # Skip if path pattern is provided and doesn't match
-            if path_pattern and not re.search(path_pattern, parsed_url.path):
-                continue
-                
-            # Extract query parameters
-            query_params = {}
-            for param in request.get('queryString', []):
-                query_params[param.get('name', '')] = param.get('value', '')
-                
-            # Extract headers
-            headers = {}
-            for header in request.get('headers', []):
-                headers[header.get('name', '')] = header.get('value', '')
-                
-            # Extract post data if available
-            post_data = None
-            if 'postData' in request:
-                post_data = request['postData'].get('text', '')
-                try:
-                    # Try to parse as JSON
-                    post_data = json.loads(post_data)
-                except (json.JSONDecodeError, TypeError):
-                    # Keep as string if not valid JSON
-                    pass
-            
-            endpoint_info = {
-                'url': url,
-                'method': request_method,
-                'protocol': parsed_url.scheme,
-                'domain': parsed_url.netloc,
-                'path': parsed_url.path,
-                'query_params': query_params,
-                'headers': headers,
-                'post_data': post_data,
-                'status_code': response_status,
-                'response_size': response.get('bodySize', 0),
-                'time': entry.get('time', 0),  # Response time in ms
-            }
-            
-            endpoints.append(endpoint_info)
+        Returns:
+            List of Endpoint objects
+        """
+        if isinstance(path_pattern, str):
+            path_pattern = self._compile_pattern(path_pattern)
+        fields = _check_fields(fields)
+        workers = workers or os.cpu_count() or 1
+        
+        entries, typed = self._entries_and_typed()
+        entries = list(entries)
+        if workers == 1 or len(entries) < PARALLEL_MIN_ENTRIES:
+            return _extract_endpoints(entries, typed, domain, method, status_code,
+                                      path_pattern, fields)[0]
             
+        chunk_size = max(1, len(entries) // (workers * 4))
+        chunks = [entries[i:i + chunk_size] for i in range(0, len(entries), chunk_size)]
+        extract = partial(_extract_endpoints, typed=typed, domain=domain, method=method,
+                          status_code=status_code, path_pattern=path_pattern, fields=fields)
+        
+        endpoints = []
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for chunk_endpoints, _ in executor.map(extract, chunks):
+                endpoints.extend(chunk_endpoints)
         return endpoints
-    
+        
+    def get_endpoints_table(self,
+                            domain: Optional[str] = None,
+                            method: Optional[str] = None,
+                            status_code: Optional[int] = None,
+                            path_pattern: Optional[Union[str, Pattern]] = None) -> 'pyarrow.Table':
+        """
+        Extract the flat endpoint fields as a columnar pyarrow Table.
+        
+        The table has one column per CSV_FIELDS entry, further filtering can
+        be done with pyarrow.compute, e.g. table.filter(pc.equal(table['domain'], d)).
+        
+        Args:
+            domain: Filter by domain name
+            method: Filter by HTTP method (GET, POST, etc.)
+            status_code: Filter by HTTP status code
+            path_pattern: Filter by URL path pattern (regex string or compiled pattern)
+            
+        Returns:
+            pyarrow Table of the matching endpoints
+        """
+        pa = _import_pyarrow()
+        if isinstance(path_pattern, str):
+            path_pattern = self._compile_pattern(path_pattern)
+            
+        # Append the rows straight into the columns, so no Endpoint objects
+        # are built for the table
+        entries, typed = self._entries_and_typed()
+        rows = _iter_endpoint_rows(entries, typed, domain, method, status_code,
+                                   path_pattern, frozenset(CSV_FIELDS))
+        columns = {field: [] for field in CSV_FIELDS}
+        sinks = [(Endpoint.__slots__.index(field), columns[field].append) for field in CSV_FIELDS]
+        for row in rows:
+            for index, append in sinks:
+                append(row[index])
+                
+        # Typed entries are validated by msgspec, dict entries can hold a
+        # string status or other values pyarrow can't infer a type for
+        if not typed:
+            for field in _NUMERIC_FIELDS:
+                columns[field] = list(map(_table_number, columns[field]))
+        try:
+            return pa.table({
+                field: pa.array(values) if field in _NUMERIC_FIELDS else pa.array(values, pa.string())
+                for field, values in columns.items()
+            })
+        except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+            raise ValueError(f"Invalid HAR file format: {self.har_file_path}: {e}")
+        
     def get_unique_domains(self) -> Set[str]:
         """
         Extract all unique domains from the HAR file.
@@ -127,78 +924,88 @@ class HarParser:
         Returns:
             Set of domain names
         """
-        domains = set()
-        
-        if 'log' in self.har_data and 'entries' in self.har_data['log']:
-            for entry in self.har_data['log']['entries']:
-                request = entry.get('request', {})
-                url = request.get('url', '')
-                parsed_url = urlparse(url)
-                domains.add(parsed_url.netloc)
-                
-        return domains
+        if self._domains is None:
+            netloc_scan = _load_netloc_scan()
+            if netloc_scan is not None:
+                domains = netloc_scan.unique_netlocs(self._iter_urls(), _split_url)
+            else:
+                domains = {_split_url(url)[1] for url in self._iter_urls()}
+            self._domains = domains
+            
+        return set(self._domains)
     
-    def get_api_endpoints(self, api_patterns: List[str] = None) -> List[Dict]:
+    def get_api_endpoints(self, api_patterns: List[str] = None,
+                          fields: Iterable[str] = ENDPOINT_FIELDS) -> List[Endpoint]:
         """
         Extract likely API endpoints based on common patterns.
         
         Args:
             api_patterns: List of regex patterns to identify API endpoints
+            fields: Names of the fields to extract (see get_endpoints)
             
         Returns:
-            List of dictionaries containing API endpoint information
+            List of Endpoint objects for the API endpoints
         """
         if api_patterns is None:
-            # Default patterns to identify API endpoints
-            api_patterns = [
-                r'/api/',
-                r'/v\d+/',
-                r'/rest/',
-                r'/graphql',
-                r'/gql',
-                r'\.json$',
-            ]
-            
-        pattern = '|'.join(api_patterns)
-        return self.get_endpoints(path_pattern=pattern)
+            pattern = _DEFAULT_API_RE
+        else:
+            pattern = self._compile_pattern('|'.join(api_patterns))
+        return self._get_endpoints_with_compiled(None, None, None, pattern, fields)
     
-    def export_endpoints(self, endpoints: List[Dict], output_file: str) -> None:
+    def export_endpoints(self, endpoints: List[Union[Endpoint, Dict]], output_file: str) -> None:
         """
         Export endpoints to a file.
         
         Args:
-            endpoints: List of endpoint dictionaries
+            endpoints: List of Endpoint objects or endpoint dictionaries
             output_file: Path to the output file
         """
         file_ext = os.path.splitext(output_file)[1].lower()
         
         if file_ext == '.json':
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(endpoints, f, indent=2)
+            with open(output_file, 'wb') as f:
+                f.write(endpoints_to_json(endpoints))
         elif file_ext == '.csv':
             if not endpoints:
                 with open(output_file, 'w', encoding='utf-8') as f:
                     f.write("No endpoints found")
                 return
                 
-            # Flatten the nested dictionaries for CSV export
-            flattened = []
-            for ep in endpoints:
-                flat_ep = {
-                    'url': ep['url'],
-                    'method': ep['method'],
-                    'protocol': ep['protocol'],
-                    'domain': ep['domain'],
-                    'path': ep['path'],
-                    'status_code': ep['status_code'],
-                    'response_size': ep['response_size'],
-                    'time': ep['time'],
-                }
-                flattened.append(flat_ep)
-                
+            # Write the flat fields row by row straight from the endpoints
+            if isinstance(endpoints[0], Endpoint):
+                row = attrgetter(*CSV_FIELDS)
+            else:
+                row = itemgetter(*CSV_FIELDS)
             with open(output_file, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=flattened[0].keys())
-                writer.writeheader()
-                writer.writerows(flattened)
+                writer = csv.writer(f)
+                writer.writerow(CSV_FIELDS)
+                writer.writerows(map(row, endpoints))
+        else:
+            raise ValueError(f"Unsupported file format: {file_ext}")
+            
+    def export_table(self, table: 'pyarrow.Table', output_file: str) -> None:
+        """
+        Export a table from get_endpoints_table to a file.
+        
+        CSV files are written by pyarrow's native CSV writer.
+        
+        Args:
+            table: pyarrow Table of endpoints
+            output_file: Path to the output file
+        """
+        file_ext = os.path.splitext(output_file)[1].lower()
+        
+        if file_ext == '.json':
+            with open(output_file, 'wb') as f:
+                f.write(endpoints_to_json(table.to_pylist()))
+        elif file_ext == '.csv':
+            if not table.num_rows:
+                with open(output_file, 'w', encoding='utf-8') as f:
+                    f.write("No endpoints found")
+                return
+                
+            pa = _import_pyarrow()
+            options = pa.csv.WriteOptions(quoting_style='needed')
+            pa.csv.write_csv(table, output_file, write_options=options)
         else:
             raise ValueError(f"Unsupported file format: {file_ext}")
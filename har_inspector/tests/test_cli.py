@@ -0,0 +1,82 @@
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+from har_inspector import cli
+from har_inspector.parser import HarParser
+
+
+class TestCli(unittest.TestCase):
+    
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.har_file_path = os.path.join(self.temp_dir.name, 'test.har')
+        self._write_har(["https://example.com/login"])
+        cli._get_parser.cache_clear()
+    
+    def tearDown(self):
+        cli._get_parser.cache_clear()
+        self.temp_dir.cleanup()
+    
+    def _write_har(self, urls):
+        har_data = {
+            "log": {
+                "entries": [
+                    {"request": {"method": "GET", "url": url}, "response": {"status": 200}}
+                    for url in urls
+                ]
+            }
+        }
+        with open(self.har_file_path, 'w', encoding='utf-8') as f:
+            json.dump(har_data, f)
+    
+    def _run(self, args):
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            self.assertEqual(cli.main(args), 0)
+        return stdout.getvalue()
+    
+    def test_parser_reused_until_file_changes(self):
+        args = [self.har_file_path, '--list-domains']
+        with mock.patch.object(cli, 'HarParser', wraps=HarParser) as har_parser:
+            self.assertIn('example.com', self._run(args))
+            self.assertIn('example.com', self._run(args))
+            self.assertEqual(har_parser.call_count, 1)
+            
+            self._write_har(["https://example.com/login", "https://api.example.com/v1/users"])
+            output = self._run(args)
+            self.assertEqual(har_parser.call_count, 2)
+            self.assertIn('api.example.com', output)
+    
+    def test_relative_path_after_chdir(self):
+        other_dir = os.path.join(self.temp_dir.name, 'other')
+        os.mkdir(other_dir)
+        other_path = os.path.join(other_dir, 'test.har')
+        with open(self.har_file_path, 'rb') as f:
+            data = f.read().replace(b'example.com', b'example.org')
+        with open(other_path, 'wb') as f:
+            f.write(data)
+        st = os.stat(self.har_file_path)
+        os.utime(other_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+        
+        cwd = os.getcwd()
+        try:
+            os.chdir(self.temp_dir.name)
+            self.assertIn('example.com', self._run(['test.har', '--list-domains']))
+            os.chdir(other_dir)
+            self.assertIn('example.org', self._run(['test.har', '--list-domains']))
+        finally:
+            os.chdir(cwd)
+            
+    def test_missing_file(self):
+        stderr = io.StringIO()
+        with contextlib.redirect_stderr(stderr):
+            self.assertEqual(cli.main([os.path.join(self.temp_dir.name, 'missing.har')]), 1)
+        self.assertIn('HAR file not found', stderr.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,8 +1,40 @@
 import json
 import os
+import re
+import sys
 import tempfile
 import unittest
-from har_inspector.parser import HarParser
+from unittest import mock
+from urllib.parse import urlsplit
+from har_inspector import parser as parser_module
+from har_inspector.parser import Endpoint, HarParser
+
+
+class TestSplitUrl(unittest.TestCase):
+    
+    URLS = [
+        "https://api.example.com/v1/users?page=1#top",
+        "HTTP://example.com",
+        "https://example.com?q=1",
+        "https://example.com#frag",
+        "wss://example.com:8443/socket",
+        "https://user@example.com/a;b/c",
+        "data:text/plain;base64,SGVsbG8=",
+        "blob:https://example.com/1234",
+        "/relative/path?next=https://example.com",
+        "//example.com/protocol-relative",
+        " https://x.com/a",
+        "héllo://x.com/",
+        "https://ex\tample.com/",
+        "https://example.com/a\r\nb",
+        "",
+    ]
+    
+    def test_matches_urlsplit(self):
+        for url in self.URLS:
+            parts = urlsplit(url)
+            self.assertEqual(parser_module._split_url(url),
+                             (parts.scheme, parts.netloc, parts.path), url)
 
 
 class TestHarParser(unittest.TestCase):
@@ -68,6 +100,36 @@ class TestHarParser(unittest.TestCase):
     def test_load_har_file(self):
         self.assertEqual(self.parser.har_data, self.har_data)
         
+    def test_load_large_har_file(self):
+        # Force the memory-mapped loading path
+        with mock.patch.object(parser_module, 'MMAP_THRESHOLD', 0):
+            parser = HarParser(self.har_file_path)
+        self.assertEqual(parser.har_data, self.har_data)
+        
+    def test_load_har_file_cache_needs_msgspec(self):
+        cache_file = self.har_file_path + parser_module.CACHE_SUFFIX
+        with mock.patch.dict(os.environ, {'HAR_INSPECTOR_CACHE': '1'}), \
+                mock.patch.object(parser_module, 'msgspec', None):
+            self.assertEqual(HarParser(self.har_file_path).har_data, self.har_data)
+        self.assertFalse(os.path.exists(cache_file))
+        
+    @unittest.skipIf(parser_module.msgspec is None, "msgspec not installed")
+    def test_load_har_file_cache(self):
+        cache_file = self.har_file_path + parser_module.CACHE_SUFFIX
+        with mock.patch.dict(os.environ, {'HAR_INSPECTOR_CACHE': '1'}):
+            self.assertEqual(HarParser(self.har_file_path).har_data, self.har_data)
+            self.assertTrue(os.path.exists(cache_file))
+            
+            with mock.patch.object(HarParser, '_parse_har_file') as parse:
+                self.assertEqual(HarParser(self.har_file_path).har_data, self.har_data)
+            parse.assert_not_called()
+            
+            # A modified HAR file invalidates the cache
+            self.har_data['log']['entries'].pop()
+            with open(self.har_file_path, 'w', encoding='utf-8') as f:
+                json.dump(self.har_data, f)
+            self.assertEqual(HarParser(self.har_file_path).har_data, self.har_data)
+            
     def test_get_endpoints(self):
         endpoints = self.parser.get_endpoints()
         self.assertEqual(len(endpoints), 2)
@@ -75,6 +137,156 @@ class TestHarParser(unittest.TestCase):
         self.assertEqual(endpoints[0]['domain'], 'api.example.com')
         self.assertEqual(endpoints[0]['path'], '/v1/users')
         
+    @unittest.skipIf(parser_module.ijson is None, "ijson not installed")
+    def test_streaming_does_not_load_har_data(self):
+        # Streaming takes precedence over the typed msgspec decode
+        parser = HarParser(self.har_file_path)
+        self.assertIsNone(parser._entries)
+        self.assertEqual(len(parser.get_endpoints()), 2)
+        self.assertEqual(len(parser.get_unique_domains()), 2)
+        self.assertIsNone(parser._har_data)
+        
+    @unittest.skipIf(parser_module._schema is None, "msgspec not installed")
+    def test_typed_entries(self):
+        with mock.patch.object(parser_module, 'ijson', None):
+            typed_parser = HarParser(self.har_file_path)
+            with mock.patch.object(parser_module, '_schema', None):
+                dict_parser = HarParser(self.har_file_path)
+        self.assertIsNotNone(typed_parser._entries)
+        self.assertIsNone(typed_parser._har_data)
+        self.assertIsNone(dict_parser._entries)
+        self.assertEqual(typed_parser.get_endpoints(), dict_parser.get_endpoints())
+        
+        # Files that don't fit the schema fall back to the dict based path
+        self.har_data['log']['entries'][0]['response']['status'] = '200'
+        with open(self.har_file_path, 'w', encoding='utf-8') as f:
+            json.dump(self.har_data, f)
+        with mock.patch.object(parser_module, 'ijson', None):
+            parser = HarParser(self.har_file_path)
+        self.assertIsNone(parser._entries)
+        self.assertEqual(parser.get_endpoints()[0]['status_code'], '200')
+        
+    def test_endpoint(self):
+        endpoint = self.parser.get_endpoints()[0]
+        self.assertIsInstance(endpoint, Endpoint)
+        self.assertEqual(endpoint.url, 'https://api.example.com/v1/users')
+        self.assertEqual(endpoint['status_code'], 200)
+        self.assertEqual(endpoint.to_dict()['time'], 150)
+        with self.assertRaises(KeyError):
+            endpoint['to_dict']
+            
+    def test_get_endpoints_params_and_headers(self):
+        endpoints = self.parser.get_endpoints()
+        self.assertEqual(endpoints[0]['query_params'], {'page': '1'})
+        self.assertEqual(endpoints[0]['headers'], {'Accept': 'application/json'})
+        self.assertEqual(endpoints[1]['query_params'], {})
+        
+    def test_get_endpoints_incomplete_headers(self):
+        self.har_data['log']['entries'][0]['request']['headers'].append({'name': 'X-Empty'})
+        with open(self.har_file_path, 'w', encoding='utf-8') as f:
+            json.dump(self.har_data, f)
+            
+        endpoints = HarParser(self.har_file_path).get_endpoints()
+        self.assertEqual(endpoints[0]['headers'],
+                         {'Accept': 'application/json', 'X-Empty': ''})
+        
+    def test_get_endpoints_post_data(self):
+        entries = self.har_data['log']['entries']
+        entries.append({
+            "request": {
+                "method": "POST",
+                "url": "https://example.com/form",
+                "postData": {"mimeType": "text/plain", "text": "{\"a\": 1}"}
+            },
+            "response": {"status": 200}
+        })
+        entries.append({
+            "request": {
+                "method": "POST",
+                "url": "https://example.com/broken",
+                "postData": {"mimeType": "application/json", "text": "a=1"}
+            },
+            "response": {"status": 200}
+        })
+        entries.append({
+            "request": {
+                "method": "POST",
+                "url": "https://example.com/upper",
+                "postData": {"mimeType": "Application/JSON; charset=utf-8", "text": "[1, 2]"}
+            },
+            "response": {"status": 200}
+        })
+        entries.append({
+            "request": {
+                "method": "POST",
+                "url": "https://example.com/null",
+                "postData": {"mimeType": None, "text": "{}"}
+            },
+            "response": {"status": 200}
+        })
+        with open(self.har_file_path, 'w', encoding='utf-8') as f:
+            json.dump(self.har_data, f)
+            
+        endpoints = HarParser(self.har_file_path).get_endpoints(method='POST')
+        self.assertEqual(endpoints[0]['post_data'], {'username': 'test', 'password': 'test123'})
+        self.assertEqual(endpoints[1]['post_data'], '{"a": 1}')
+        self.assertEqual(endpoints[2]['post_data'], 'a=1')
+        self.assertEqual(endpoints[3]['post_data'], [1, 2])
+        self.assertEqual(endpoints[4]['post_data'], '{}')
+        
+    def test_get_endpoints_fields(self):
+        endpoints = self.parser.get_endpoints(fields=('url', 'method', 'headers'))
+        self.assertEqual(endpoints[0].to_dict(), {
+            'url': 'https://api.example.com/v1/users',
+            'method': 'GET',
+            'protocol': None,
+            'domain': None,
+            'path': None,
+            'query_params': None,
+            'headers': {'Accept': 'application/json'},
+            'post_data': None,
+            'status_code': None,
+            'response_size': None,
+            'time': None,
+        })
+        
+        # URLs are not split when none of their parts are needed
+        with mock.patch.object(parser_module, '_split_url') as split_url:
+            endpoints = self.parser.get_endpoints(method='GET', fields=('url', 'method'))
+        split_url.assert_not_called()
+        self.assertEqual(endpoints[0].url, 'https://api.example.com/v1/users')
+        self.assertIsNone(endpoints[0].domain)
+        
+        with self.assertRaises(ValueError):
+            self.parser.get_endpoints(fields=('url', 'cookies'))
+        
+    def test_get_endpoints_parallel(self):
+        expected = self.parser.get_endpoints(method='POST')
+        self.assertEqual(self.parser.get_endpoints_parallel(method='POST'), expected)
+        
+        with mock.patch.object(parser_module, 'PARALLEL_MIN_ENTRIES', 0):
+            endpoints = self.parser.get_endpoints_parallel(method='POST', workers=2)
+        self.assertEqual(endpoints, expected)
+        
+    def test_get_endpoints_shares_strings(self):
+        endpoints = self.parser.get_endpoints()
+        self.assertIs(endpoints[0]['protocol'], endpoints[1]['protocol'])
+        self.assertIs(endpoints[0]['method'], sys.intern('GET'))
+        
+    def test_get_endpoints_null_method(self):
+        self.har_data['log']['entries'][0]['request']['method'] = None
+        with open(self.har_file_path, 'w', encoding='utf-8') as f:
+            json.dump(self.har_data, f)
+            
+        endpoints = HarParser(self.har_file_path).get_endpoints()
+        self.assertIsNone(endpoints[0]['method'])
+        self.assertEqual(endpoints[1]['method'], 'POST')
+        
+        with mock.patch.object(parser_module, 'ijson', None), \
+                mock.patch.object(parser_module, '_schema', None):
+            endpoints = HarParser(self.har_file_path).get_endpoints()
+        self.assertIsNone(endpoints[0]['method'])
+        
     def test_filter_by_domain(self):
         endpoints = self.parser.get_endpoints(domain='api.example.com')
         self.assertEqual(len(endpoints), 1)
@@ -85,6 +297,12 @@ class TestHarParser(unittest.TestCase):
         self.assertEqual(len(endpoints), 1)
         self.assertEqual(endpoints[0]['method'], 'POST')
         
+    def test_filter_by_pattern(self):
+        for pattern in (r'^/v\d+/', re.compile(r'^/v\d+/')):
+            endpoints = self.parser.get_endpoints(path_pattern=pattern)
+            self.assertEqual(len(endpoints), 1)
+            self.assertEqual(endpoints[0]['path'], '/v1/users')
+            
     def test_get_api_endpoints(self):
         endpoints = self.parser.get_api_endpoints()
         self.assertEqual(len(endpoints), 1)
@@ -96,6 +314,83 @@ class TestHarParser(unittest.TestCase):
         self.assertIn('api.example.com', domains)
         self.assertIn('example.com', domains)
         
+    def test_get_unique_domains_entry_without_url(self):
+        self.har_data['log']['entries'].append({"request": {"method": "GET"}})
+        self.har_data['log']['entries'].append({"response": {"status": 200}})
+        with open(self.har_file_path, 'w', encoding='utf-8') as f:
+            json.dump(self.har_data, f)
+            
+        expected = {'', 'api.example.com', 'example.com'}
+        self.assertEqual(HarParser(self.har_file_path).get_unique_domains(), expected)
+        with mock.patch.object(parser_module, 'ijson', None):
+            self.assertEqual(HarParser(self.har_file_path).get_unique_domains(), expected)
+            with mock.patch.object(parser_module, '_schema', None):
+                self.assertEqual(HarParser(self.har_file_path).get_unique_domains(), expected)
+                
+    def test_get_unique_domains_numba(self):
+        try:
+            import numba  # noqa: F401
+        except ImportError:
+            self.skipTest("numba not installed")
+            
+        with mock.patch.dict(os.environ, {'HAR_INSPECTOR_USE_NUMBA': '1'}):
+            domains = HarParser(self.har_file_path).get_unique_domains()
+        self.assertEqual(domains, {'api.example.com', 'example.com'})
+        
+    def test_netloc_scan_matches_split_url(self):
+        try:
+            import numba  # noqa: F401
+        except ImportError:
+            self.skipTest("numba not installed")
+            
+        from har_inspector import _netloc_scan
+        split_url = parser_module._split_url
+        urls = TestSplitUrl.URLS + [
+            f"https://host{i % 3000}.example.com/path/{i}?q={i}" for i in range(6000)
+        ]
+        expected = {split_url(url)[1] for url in urls}
+        self.assertEqual(_netloc_scan.unique_netlocs(urls, split_url), expected)
+        
+        # With a zero FNV prime every netloc hashes the same, so every new
+        # netloc goes through the collision confirmation
+        with mock.patch.object(_netloc_scan, '_FNV_PRIME', _netloc_scan.np.uint64(0)), \
+                mock.patch.object(_netloc_scan, 'scan_netlocs', _netloc_scan.scan_netlocs.py_func):
+            self.assertEqual(_netloc_scan.unique_netlocs(urls[:300], split_url),
+                             {split_url(url)[1] for url in urls[:300]})
+        
+    def test_get_unique_domains_after_get_endpoints(self):
+        self.parser.get_endpoints(domain='example.com')
+        self.assertIsNone(self.parser._domains)
+        
+        self.parser.get_endpoints()
+        self.assertEqual(self.parser._domains, {'api.example.com', 'example.com'})
+        self.assertEqual(self.parser.get_unique_domains(), {'api.example.com', 'example.com'})
+        
+    def test_get_unique_domains_matches_get_endpoints(self):
+        self.har_data['log']['entries'].append({"request": {"method": "GET", "url": " https://x.com/a"}})
+        with open(self.har_file_path, 'w', encoding='utf-8') as f:
+            json.dump(self.har_data, f)
+            
+        parser = HarParser(self.har_file_path)
+        domains = parser.get_unique_domains()
+        self.assertEqual(domains, {'api.example.com', 'example.com', 'x.com'})
+        parser._domains = None
+        parser.get_endpoints()
+        self.assertEqual(parser.get_unique_domains(), domains)
+        
+    def test_export_to_json_non_str_names(self):
+        self.har_data['log']['entries'][0]['request']['headers'].append({"name": None, "value": "x"})
+        self.har_data['log']['entries'][0]['request']['queryString'].append({"name": 1, "value": "y"})
+        with open(self.har_file_path, 'w', encoding='utf-8') as f:
+            json.dump(self.har_data, f)
+            
+        endpoints = HarParser(self.har_file_path).get_endpoints()
+        exported = json.loads(parser_module.endpoints_to_json(endpoints))
+        self.assertEqual(exported[0]['headers']['null'], 'x')
+        self.assertEqual(exported[0]['query_params']['1'], 'y')
+        with mock.patch.object(parser_module, 'orjson', None):
+            self.assertEqual(json.loads(parser_module.endpoints_to_json(endpoints)), exported)
+            
     def test_export_to_json(self):
         endpoints = self.parser.get_endpoints()
         output_file = os.path.join(self.temp_dir.name, "output.json")
@@ -130,6 +425,56 @@ class TestHarParser(unittest.TestCase):
         self.assertIn('api.example.com', content)
         self.assertIn('example.com/login', content)
         
+    def test_export_to_csv_with_csv_fields(self):
+        endpoints = self.parser.get_endpoints(fields=parser_module.CSV_FIELDS)
+        output_file = os.path.join(self.temp_dir.name, "output.csv")
+        
+        self.parser.export_endpoints(endpoints, output_file)
+        
+        with open(output_file, 'r', encoding='utf-8') as f:
+            content = f.read()
+            
+        self.assertIn('url,method,protocol,domain,path,status_code,response_size,time', content)
+        self.assertIn('https://example.com/login,POST,https,example.com,/login,200,512,200', content)
+        
+    def test_get_endpoints_table(self):
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            self.skipTest("pyarrow not installed")
+            
+        table = self.parser.get_endpoints_table(method='POST')
+        self.assertEqual(table.column_names, list(parser_module.CSV_FIELDS))
+        endpoints = self.parser.get_endpoints(method='POST')
+        self.assertEqual(table.to_pylist(), [
+            {field: ep[field] for field in parser_module.CSV_FIELDS} for ep in endpoints
+        ])
+        
+        output_file = os.path.join(self.temp_dir.name, "output.csv")
+        self.parser.export_table(self.parser.get_endpoints_table(), output_file)
+        
+        with open(output_file, 'r', encoding='utf-8') as f:
+            content = f.read()
+            
+        self.assertIn('"url","method","protocol","domain","path","status_code","response_size","time"', content)
+        self.assertIn('"https://example.com/login","POST","https","example.com","/login",200,512,200', content)
+        
+    def test_get_endpoints_table_string_numbers(self):
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            self.skipTest("pyarrow not installed")
+            
+        self.har_data['log']['entries'][0]['response']['status'] = '200'
+        self.har_data['log']['entries'][1]['response']['bodySize'] = 'unknown'
+        with open(self.har_file_path, 'w', encoding='utf-8') as f:
+            json.dump(self.har_data, f)
+            
+        table = HarParser(self.har_file_path).get_endpoints_table()
+        self.assertEqual(table.column('status_code').to_pylist(), [200, 200])
+        self.assertEqual(table.column('response_size').to_pylist(), [1024, None])
+        self.assertEqual(table.column('domain').to_pylist(), ['api.example.com', 'example.com'])
+        
     def test_invalid_har_file(self):
         invalid_file = os.path.join(self.temp_dir.name, "invalid.har")
         
@@ -18,7 +18,15 @@ setup(
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
     ],
-    python_requires=">=3.6",
+    python_requires=">=3.7",
+    extras_require={
+        "fast": ["orjson"],
+        "stream": ["ijson>=3.1"],
+        "numba": ["numba", "numpy"],
+        "typed": ["msgspec"],
+        "cache": ["msgspec"],
+        "arrow": ["pyarrow>=7"],
+    },
     entry_points={
         "console_scripts": [
             "har-inspector=har_inspector.cli:main",